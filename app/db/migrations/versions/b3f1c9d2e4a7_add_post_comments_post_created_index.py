@@ -0,0 +1,35 @@
+"""add_post_comments_post_created_index
+
+Revision ID: b3f1c9d2e4a7
+Revises: 7c6b83ddd731
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c9d2e4a7'
+down_revision: Union[str, None] = '7c6b83ddd731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recent comments for a post are read as an index range scan instead of
+    # fetching every comment of the post and sorting by created_at
+    op.create_index(
+        'idx_post_comments_post_id_created_at',
+        'post_comments',
+        ['post_id', 'created_at']
+    )
+    # The composite index's leading post_id column makes this one redundant
+    op.drop_index('idx_post_comments_post_id', table_name='post_comments')
+
+
+def downgrade() -> None:
+    op.create_index('idx_post_comments_post_id', 'post_comments', ['post_id'])
+    op.drop_index('idx_post_comments_post_id_created_at', table_name='post_comments')
@@ -0,0 +1,28 @@
+"""add_locations_lat_lng_index
+
+Revision ID: d8e2a6f4c1b9
+Revises: b3f1c9d2e4a7
+Create Date: 2026-10-17 10:04:18.902215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e2a6f4c1b9'
+down_revision: Union[str, None] = 'b3f1c9d2e4a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets the lat/lng BETWEEN prefilter of nearest/nearby lookups use an
+    # index range scan instead of computing distances for every location
+    op.create_index('idx_locations_lat_lng', 'locations', ['lat', 'lng'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_locations_lat_lng', table_name='locations')
@@ -128,10 +128,14 @@ class PostComment(Base):
 # Indexes for performance
 # Standard indexes that work on both databases
 Index('idx_locations_name', Location.name)
+# Serves the lat/lng bounding-box prefilter used by nearest/nearby lookups
+Index('idx_locations_lat_lng', Location.lat, Location.lng)
 Index('idx_posts_location_id', Post.location_id)
 Index('idx_posts_created_at', Post.created_at)
 Index('idx_posts_like_count', Post.like_count)
 Index('idx_post_media_post_id', PostMedia.post_id)
-Index('idx_post_comments_post_id', PostComment.post_id)
 Index('idx_post_comments_user_id', PostComment.user_id)
-Index('idx_post_comments_created_at', PostComment.created_at)
\ No newline at end of file
+Index('idx_post_comments_created_at', PostComment.created_at)
+# Serves "recent comments for a post" (WHERE post_id ORDER BY created_at DESC LIMIT n);
+# its leading post_id column also covers plain post_id lookups
+Index('idx_post_comments_post_id_created_at', PostComment.post_id, PostComment.created_at)
\ No newline at end of file
@@ -5,7 +5,7 @@ from sqlalchemy.orm import selectinload
 import uuid
 
 from app.db.models import Location, Post
-from app.utils.ranking import haversine_distance
+from app.utils.ranking import haversine_distance, bounding_box
 from app.schemas.locations import (
     LocationResponse, LocationDetailResponse, NearbyLocationResponse, AutocompleteLocationResponse
 )
@@ -156,21 +156,28 @@ class LocationService:
     ) -> List[Location]:
         """Find nearby locations using geographic distance"""
         
+        # Restrict the exact distance calculation to the radius' bounding box
+        min_lat, max_lat, min_lng, max_lng = bounding_box(center_lat, center_lng, radius_km)
+        
         # Use PostGIS if available, otherwise Haversine formula
         distance_query = text("""
-            SELECT *, 
-            (6371 * acos(
-                cos(radians(:center_lat)) * 
-                cos(radians(lat)) * 
-                cos(radians(lng) - radians(:center_lng)) + 
-                sin(radians(:center_lat)) * 
-                sin(radians(lat))
-            )) AS distance_km
-            FROM locations 
-            WHERE lat IS NOT NULL 
-              AND lng IS NOT NULL
-              AND id != :exclude_id
-            HAVING distance_km <= :radius_km
+            SELECT * FROM (
+                SELECT *, 
+                (6371 * acos(
+                    cos(radians(:center_lat)) * 
+                    cos(radians(lat)) * 
+                    cos(radians(lng) - radians(:center_lng)) + 
+                    sin(radians(:center_lat)) * 
+                    sin(radians(lat))
+                )) AS distance_km
+                FROM locations 
+                WHERE lat IS NOT NULL 
+                  AND lng IS NOT NULL
+                  AND lat BETWEEN :min_lat AND :max_lat
+                  AND lng BETWEEN :min_lng AND :max_lng
+                  AND id != :exclude_id
+            ) AS candidates
+            WHERE distance_km <= :radius_km
             ORDER BY distance_km
             LIMIT 50
         """)
@@ -181,7 +188,11 @@ class LocationService:
                 "center_lat": center_lat,
                 "center_lng": center_lng,
                 "radius_km": radius_km,
-                "exclude_id": exclude_id
+                "exclude_id": exclude_id,
+                "min_lat": min_lat,
+                "max_lat": max_lat,
+                "min_lng": min_lng,
+                "max_lng": max_lng
             }
         )
         
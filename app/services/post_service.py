@@ -4,7 +4,7 @@ from sqlalchemy import select, text, func, and_
 import uuid
 
 from app.db.models import Post, PostMedia, Location
-from app.utils.ranking import haversine_distance
+from app.utils.ranking import haversine_distance, bounding_box
 from app.schemas.posts import PostCreate, PostResponse, PostUploadResponse, PostMediaCreate, PostListResponse
 from app.core.logging import logger
 
@@ -130,20 +130,28 @@ class PostService:
         Returns:
             Nearest Location or None
         """
+        # Only locations inside the radius' bounding box can match, so filter
+        # on plain lat/lng ranges before computing the exact distance
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, max_distance_km)
+        
         # Use geographic distance calculation
         distance_query = text("""
-            SELECT *, 
-            (6371 * acos(
-                cos(radians(:lat)) * 
-                cos(radians(lat)) * 
-                cos(radians(lng) - radians(:lng)) + 
-                sin(radians(:lat)) * 
-                sin(radians(lat))
-            )) AS distance_km
-            FROM locations 
-            WHERE lat IS NOT NULL 
-              AND lng IS NOT NULL
-            HAVING distance_km <= :max_distance
+            SELECT * FROM (
+                SELECT *, 
+                (6371 * acos(
+                    cos(radians(:lat)) * 
+                    cos(radians(lat)) * 
+                    cos(radians(lng) - radians(:lng)) + 
+                    sin(radians(:lat)) * 
+                    sin(radians(lat))
+                )) AS distance_km
+                FROM locations 
+                WHERE lat IS NOT NULL 
+                  AND lng IS NOT NULL
+                  AND lat BETWEEN :min_lat AND :max_lat
+                  AND lng BETWEEN :min_lng AND :max_lng
+            ) AS candidates
+            WHERE distance_km <= :max_distance
             ORDER BY distance_km
             LIMIT 1
         """)
@@ -153,7 +161,11 @@ class PostService:
             {
                 "lat": lat,
                 "lng": lng,
-                "max_distance": max_distance_km
+                "max_distance": max_distance_km,
+                "min_lat": min_lat,
+                "max_lat": max_lat,
+                "min_lng": min_lng,
+                "max_lng": max_lng
             }
         )
         
@@ -1,8 +1,11 @@
 import json
 import os
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set
 from pathlib import Path
 
+# Maximum number of distinct queries kept in the expansion cache
+EXPANSION_CACHE_SIZE = 4096
+
 
 class ExpansionLoader:
     """Loads and manages keyword expansion data"""
@@ -15,10 +18,12 @@ class ExpansionLoader:
         
         self.expansion_file = expansion_file
         self._data = None
+        self._expansion_cache: Dict[str, FrozenSet[str]] = {}
         self._load_expansion_data()
     
     def _load_expansion_data(self) -> None:
         """Load expansion data from JSON file"""
+        self._expansion_cache.clear()
         try:
             with open(self.expansion_file, 'r', encoding='utf-8') as f:
                 self._data = json.load(f)
@@ -69,12 +74,25 @@ class ExpansionLoader:
         """
         Expand query with related terms
         
+        Expansions are cached per query; each call returns a fresh set,
+        so callers may modify it freely.
+        
         Args:
             query: Original search query
             
         Returns:
             Set of expanded terms including original
         """
+        cached = self._expansion_cache.get(query)
+        if cached is None:
+            if len(self._expansion_cache) >= EXPANSION_CACHE_SIZE:
+                self._expansion_cache.clear()
+            cached = frozenset(self._expand_query(query))
+            self._expansion_cache[query] = cached
+        return set(cached)
+    
+    def _expand_query(self, query: str) -> Set[str]:
+        """Compute the expansion of a query against the loaded data"""
         expanded_terms = {query}
         query_lower = query.lower()
         
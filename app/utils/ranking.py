@@ -1,9 +1,57 @@
 import math
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 from app.core.config import settings
 
 
+def _popularity_score(like_count: int, comment_count: int, alpha_comment: float) -> float:
+    """Normalized popularity score (0-1) for a given comment weight"""
+    raw_score = like_count + (alpha_comment * comment_count)
+    
+    # Improved normalization using sigmoid-like function
+    # This ensures the score stays within 0-1 range
+    max_expected_score = 1000  # Adjust based on typical content engagement
+    normalized_score = raw_score / (raw_score + max_expected_score)
+    
+    return min(normalized_score, 1.0)  # Ensure it never exceeds 1.0
+
+
+def _recency_decay(created_at: datetime, now: datetime, tau_minutes: float) -> float:
+    """Recency decay score (0-1) of created_at relative to now"""
+    age_minutes = (now - created_at).total_seconds() / 60
+    
+    # Exponential decay
+    return math.exp(-age_minutes / tau_minutes)
+
+
+def _combined_score(
+    like_count: int,
+    comment_count: int,
+    created_at: datetime,
+    weights: Dict[str, float],
+    alpha_comment: float,
+    tau_minutes: float,
+    now: datetime
+) -> Tuple[float, Dict[str, float]]:
+    """Combined ranking score with settings and the clock already resolved"""
+    w_pop = weights.get("w_pop", 0.7)
+    w_recency = weights.get("w_recency", 0.3)
+    
+    popularity_norm = _popularity_score(like_count, comment_count, alpha_comment)
+    recency_decay = _recency_decay(created_at, now, tau_minutes)
+    
+    combined_score = (w_pop * popularity_norm) + (w_recency * recency_decay)
+    
+    component_scores = {
+        "popularity": popularity_norm,
+        "recency": recency_decay,
+        "combined": combined_score,
+        "weights_used": weights
+    }
+    
+    return combined_score, component_scores
+
+
 def calculate_popularity_score(like_count: int, comment_count: int) -> float:
     """
     Calculate normalized popularity score
@@ -15,15 +63,7 @@ def calculate_popularity_score(like_count: int, comment_count: int) -> float:
     Returns:
         Normalized popularity score (0-1)
     """
-    alpha_comment = settings.alpha_comment
-    raw_score = like_count + (alpha_comment * comment_count)
-    
-    # Improved normalization using sigmoid-like function
-    # This ensures the score stays within 0-1 range
-    max_expected_score = 1000  # Adjust based on typical content engagement
-    normalized_score = raw_score / (raw_score + max_expected_score)
-    
-    return min(normalized_score, 1.0)  # Ensure it never exceeds 1.0
+    return _popularity_score(like_count, comment_count, settings.alpha_comment)
 
 
 def calculate_recency_decay(created_at: datetime) -> float:
@@ -36,12 +76,7 @@ def calculate_recency_decay(created_at: datetime) -> float:
     Returns:
         Recency decay score (0-1)
     """
-    now = datetime.utcnow()
-    age_minutes = (now - created_at).total_seconds() / 60
-    tau_minutes = settings.tau_minutes
-    
-    # Exponential decay
-    return math.exp(-age_minutes / tau_minutes)
+    return _recency_decay(created_at, datetime.utcnow(), settings.tau_minutes)
 
 
 def calculate_combined_score(
@@ -65,22 +100,44 @@ def calculate_combined_score(
     if weights is None:
         weights = settings.search_weights
     
-    w_pop = weights.get("w_pop", 0.7)
-    w_recency = weights.get("w_recency", 0.3)
+    return _combined_score(
+        like_count, comment_count, created_at, weights,
+        settings.alpha_comment, settings.tau_minutes, datetime.utcnow()
+    )
+
+
+def calculate_combined_scores(
+    items: Iterable[Tuple[int, int, datetime]],
+    weights: Dict[str, float] = None
+) -> List[Tuple[float, Dict[str, float]]]:
+    """
+    Calculate combined ranking scores for many items in one pass
     
-    popularity_norm = calculate_popularity_score(like_count, comment_count)
-    recency_decay = calculate_recency_decay(created_at)
+    Settings, weights and the current time are resolved once for the
+    whole batch instead of once per item, so every item is scored against
+    the same clock.
     
-    combined_score = (w_pop * popularity_norm) + (w_recency * recency_decay)
+    Args:
+        items: Iterable of (like_count, comment_count, created_at)
+        weights: Custom weights (optional)
+        
+    Returns:
+        List of (combined_score, component_scores), in input order
+    """
+    if weights is None:
+        weights = settings.search_weights
     
-    component_scores = {
-        "popularity": popularity_norm,
-        "recency": recency_decay,
-        "combined": combined_score,
-        "weights_used": weights
-    }
+    alpha_comment = settings.alpha_comment
+    tau_minutes = settings.tau_minutes
+    now = datetime.utcnow()
     
-    return combined_score, component_scores
+    return [
+        _combined_score(
+            like_count, comment_count, created_at, weights,
+            alpha_comment, tau_minutes, now
+        )
+        for like_count, comment_count, created_at in items
+    ]
 
 
 def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
@@ -106,4 +163,74 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     # Earth radius in kilometers
     earth_radius = 6371
     
-    return earth_radius * c
\ No newline at end of file
+    return earth_radius * c
+
+
+def haversine_distances(
+    lat: float,
+    lng: float,
+    points: Iterable[Tuple[float, float]]
+) -> List[float]:
+    """
+    Calculate haversine distances from one origin to many points in kilometers
+    
+    The origin's radians and cosine are computed once for the whole batch.
+    
+    Args:
+        lat, lng: Origin coordinates
+        points: Iterable of (lat, lng) destination coordinates
+        
+    Returns:
+        List of distances in kilometers, in input order
+    """
+    earth_radius = 6371
+    radians, sin, cos, asin, sqrt = math.radians, math.sin, math.cos, math.asin, math.sqrt
+    
+    lat1 = radians(lat)
+    lng1 = radians(lng)
+    cos_lat1 = cos(lat1)
+    
+    distances = []
+    for lat2, lng2 in points:
+        lat2 = radians(lat2)
+        dlat = lat2 - lat1
+        dlng = radians(lng2) - lng1
+        a = sin(dlat/2)**2 + cos_lat1 * cos(lat2) * sin(dlng/2)**2
+        distances.append(earth_radius * 2 * asin(sqrt(a)))
+    
+    return distances
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Calculate a lat/lng box that fully contains a radius around a point
+    
+    Used as a cheap, index-friendly prefilter before exact distance checks.
+    
+    Args:
+        lat, lng: Center point coordinates
+        radius_km: Radius in kilometers
+        
+    Returns:
+        Tuple of (min_lat, max_lat, min_lng, max_lng)
+    """
+    earth_radius = 6371
+    angular_radius = radius_km / earth_radius
+    lat_delta = math.degrees(angular_radius)
+    
+    min_lat = lat - lat_delta
+    max_lat = lat + lat_delta
+    
+    # Near the poles the circle covers every longitude
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+    
+    lng_delta = math.degrees(math.asin(math.sin(angular_radius) / math.cos(math.radians(lat))))
+    min_lng = lng - lng_delta
+    max_lng = lng + lng_delta
+    
+    # Crossing the antimeridian: fall back to the full longitude range
+    if min_lng < -180 or max_lng > 180:
+        return min_lat, max_lat, -180.0, 180.0
+    
+    return min_lat, max_lat, min_lng, max_lng
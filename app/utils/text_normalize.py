@@ -1,12 +1,17 @@
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Set
 
 
+@lru_cache(maxsize=8192)
 def normalize_text(text: str, preserve_thai: bool = True) -> str:
     """
     Normalize text for search purposes
     
+    Results are memoized since the same queries and field values are
+    normalized repeatedly; use normalize_text.cache_clear() to reset.
+    
     Args:
         text: Input text to normalize
         preserve_thai: Whether to preserve Thai characters (don't lowercase)
@@ -87,12 +92,8 @@ def create_ngrams(text: str, n: int = 3) -> Set[str]:
         return {text} if text else set()
     
     text = normalize_text(text)
-    ngrams = set()
-    
-    for i in range(len(text) - n + 1):
-        ngrams.add(text[i:i + n])
     
-    return ngrams
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -17,6 +17,9 @@ Requirements:
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -26,11 +29,33 @@ class DashboardClient:
     def __init__(self, base_url: str = "http://localhost:5000"):
         self.base_url = base_url
         self.token = None
+        
+        # Endpoint URLs are fixed for the client's lifetime, so build them once
+        dashboard_url = f"{base_url}/api/dashboard"
+        self._login_url = f"{base_url}/api/auth/login"
+        self._overview_url = f"{dashboard_url}/overview"
+        self._endpoints_url = f"{dashboard_url}/endpoints"
+        self._requests_by_period_url = f"{dashboard_url}/requests-by-period"
+        self._status_codes_url = f"{dashboard_url}/status-codes"
+        self._source_ips_url = f"{dashboard_url}/source-ips"
+        self._response_times_url = f"{dashboard_url}/response-times"
+        
+        # One pooled session so every call reuses kept-alive connections.
+        # The pool is sized for the concurrent fetches in get_dashboard().
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
     
     def login(self, username: str, password: str) -> bool:
         """Authenticate and get JWT token"""
         try:
-            response = requests.post(f"{self.base_url}/api/auth/login", json={
+            response = self.session.post(self._login_url, json={
                 "username": username,
                 "password": password
             })
@@ -38,6 +63,8 @@ class DashboardClient:
             if response.status_code == 200:
                 data = response.json()
                 self.token = data.get('data', {}).get('access_token')
+                # Set once on the session instead of passing headers per request
+                self.session.headers["Authorization"] = f"Bearer {self.token}"
                 return True
             else:
                 print(f"Login failed: {response.status_code}")
@@ -46,15 +73,10 @@ class DashboardClient:
             print(f"Login error: {e}")
             return False
     
-    def _get_headers(self) -> dict:
-        """Get headers with authentication"""
+    def _require_auth(self) -> None:
+        """Ensure login() has stored a token on the session"""
         if not self.token:
             raise Exception("Not authenticated. Call login() first.")
-        
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
     
     def get_overview(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> dict:
         """Get system overview"""
@@ -64,54 +86,69 @@ class DashboardClient:
         if end_date:
             params['end_date'] = end_date
         
-        response = requests.get(
-            f"{self.base_url}/api/dashboard/overview",
-            headers=self._get_headers(),
+        self._require_auth()
+        response = self.session.get(
+            self._overview_url,
             params=params
         )
         return response.json()
     
     def get_endpoints(self) -> dict:
         """Get endpoints summary"""
-        response = requests.get(
-            f"{self.base_url}/api/dashboard/endpoints",
-            headers=self._get_headers()
-        )
+        self._require_auth()
+        response = self.session.get(self._endpoints_url)
         return response.json()
     
     def get_requests_by_period(self, period: str = "day") -> dict:
         """Get request count by period"""
-        response = requests.get(
-            f"{self.base_url}/api/dashboard/requests-by-period",
-            headers=self._get_headers(),
+        self._require_auth()
+        response = self.session.get(
+            self._requests_by_period_url,
             params={"period": period}
         )
         return response.json()
     
     def get_status_codes(self) -> dict:
         """Get status code distribution"""
-        response = requests.get(
-            f"{self.base_url}/api/dashboard/status-codes",
-            headers=self._get_headers()
-        )
+        self._require_auth()
+        response = self.session.get(self._status_codes_url)
         return response.json()
     
     def get_source_ips(self, limit: int = 10) -> dict:
         """Get top source IPs"""
-        response = requests.get(
-            f"{self.base_url}/api/dashboard/source-ips",
-            headers=self._get_headers(),
+        self._require_auth()
+        response = self.session.get(
+            self._source_ips_url,
             params={"limit": limit}
         )
         return response.json()
     
     def get_response_times(self) -> dict:
         """Get response time analytics"""
-        response = requests.get(
-            f"{self.base_url}/api/dashboard/response-times",
-            headers=self._get_headers()
-        )
+        self._require_auth()
+        response = self.session.get(self._response_times_url)
         return response.json()
+    
+    def get_dashboard(self, source_ip_limit: int = 10, period: str = "day") -> dict:
+        """Fetch every dashboard section concurrently
+        
+        The sections are independent GETs, so total latency is the slowest
+        request rather than the sum of all of them.
+        """
+        calls = {
+            "overview": (self.get_overview, ()),
+            "endpoints": (self.get_endpoints, ()),
+            "status_codes": (self.get_status_codes, ()),
+            "response_times": (self.get_response_times, ()),
+            "source_ips": (self.get_source_ips, (source_ip_limit,)),
+            "requests_by_period": (self.get_requests_by_period, (period,)),
+        }
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {
+                name: executor.submit(func, *args)
+                for name, (func, args) in calls.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
 
 def print_section(title: str):
     """Print a section header"""
@@ -123,6 +160,10 @@ def format_datetime(dt_str: str) -> str:
     """Format datetime string for display"""
     if not dt_str:
         return "N/A"
+    # The API returns isoformat() timestamps, whose first 19 characters are
+    # already the display format once the 'T' separator is swapped out
+    if len(dt_str) >= 19 and dt_str[10] == 'T':
+        return dt_str[:19].replace('T', ' ')
     try:
         dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
         return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -150,9 +191,12 @@ def main():
     print("✅ Authentication successful!")
     
     try:
+        # Fetch all sections up front, then render them in order
+        dashboard = client.get_dashboard(source_ip_limit=5, period="day")
+        
         # 1. System Overview
         print_section("System Overview")
-        overview = client.get_overview()
+        overview = dashboard['overview']
         if overview['success']:
             data = overview['data']
             print(f"📈 Total Requests: {data['total_requests']:,}")
@@ -165,7 +209,7 @@ def main():
         
         # 2. Top Endpoints
         print_section("Top Endpoints")
-        endpoints = client.get_endpoints()
+        endpoints = dashboard['endpoints']
         if endpoints['success']:
             for i, endpoint in enumerate(endpoints['data'][:5], 1):
                 print(f"{i:2d}. {endpoint['method']:6s} {endpoint['endpoint']:30s}")
@@ -177,7 +221,7 @@ def main():
         
         # 3. Status Code Distribution
         print_section("Status Code Distribution")
-        status_codes = client.get_status_codes()
+        status_codes = dashboard['status_codes']
         if status_codes['success']:
             for status in status_codes['data']:
                 status_icon = "✅" if status['status_code'] < 400 else "⚠️" if status['status_code'] < 500 else "❌"
@@ -188,7 +232,7 @@ def main():
         
         # 4. Response Time Analytics
         print_section("Response Time Analytics")
-        response_times = client.get_response_times()
+        response_times = dashboard['response_times']
         if response_times['success']:
             data = response_times['data']
             print(f"⚡ Average: {data['avg_response_time']:8.2f}ms")
@@ -201,7 +245,7 @@ def main():
         
         # 5. Top Source IPs
         print_section("Top Source IPs")
-        source_ips = client.get_source_ips(limit=5)
+        source_ips = dashboard['source_ips']
         if source_ips['success']:
             for i, ip_data in enumerate(source_ips['data'], 1):
                 print(f"{i:2d}. {ip_data['source_ip']:15s} | "
@@ -212,7 +256,7 @@ def main():
         
         # 6. Request Trends (Last 7 days)
         print_section("Daily Request Trends")
-        requests_by_day = client.get_requests_by_period(period="day")
+        requests_by_day = dashboard['requests_by_period']
         if requests_by_day['success']:
             for day_data in requests_by_day['data'][-7:]:  # Last 7 days
                 print(f"📅 {day_data['period']}: {day_data['request_count']:4d} requests")
@@ -7,11 +7,13 @@ by creating an in-memory mock of the API responses.
 """
 
 import json
+import re
 import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from app.utils.text_normalize import normalize_text
 from app.utils.expansion_loader import expansion_loader
-from app.utils.ranking import calculate_combined_score
+from app.utils.ranking import calculate_combined_scores
 from app.schemas.search import SearchResponse, PostResponse, MediaResponse, LocationResponse, SuggestionResponse
 
 
@@ -58,6 +60,13 @@ def demo_search_functionality():
         }
     ]
     
+    # Lowercase captions once at ingestion instead of on every query
+    for post in mock_posts:
+        post["_caption_lower"] = post["caption"].lower()
+    
+    # Locations are static, so index them by id once for all queries
+    locations_by_id = {loc["id"]: loc for loc in mock_locations}
+    
     # Test queries
     test_queries = ["เชียงใหม่", "ทะเล", "วัด", "ภูเขา"]
     
@@ -77,27 +86,24 @@ def demo_search_functionality():
         print(f"Expanded terms: {expansion_list[:5]}")  # Show first 5
         
         # 3. Find matching posts (simple simulation)
-        matching_posts = []
-        for post in mock_posts:
-            # Simple matching logic for demo
-            score = 0.0
-            if any(term.lower() in post["caption"].lower() for term in expanded):
-                # Calculate ranking score
-                combined_score, components = calculate_combined_score(
-                    post["like_count"],
-                    post["comment_count"], 
-                    post["created_at"]
-                )
-                score = combined_score
-                matching_posts.append((post, score))
+        # One alternation pattern finds any expanded term in a single pass per caption
+        term_pattern = re.compile("|".join(re.escape(term.lower()) for term in expanded))
+        matched = [post for post in mock_posts if term_pattern.search(post["_caption_lower"])]
+        
+        # Calculate ranking scores for all matches in one batch
+        scores = calculate_combined_scores(
+            (post["like_count"], post["comment_count"], post["created_at"])
+            for post in matched
+        )
+        matching_posts = [(post, score) for post, (score, _) in zip(matched, scores)]
         
         # Sort by score
-        matching_posts.sort(key=lambda x: x[1], reverse=True)
+        matching_posts.sort(key=itemgetter(1), reverse=True)
         
         # 4. Generate response
         post_responses = []
         for post, score in matching_posts:
-            location = next((loc for loc in mock_locations if loc["id"] == post["location_id"]), None)
+            location = locations_by_id.get(post["location_id"])
             
             post_responses.append({
                 "id": post["id"],
@@ -137,14 +143,13 @@ def demo_ranking_algorithm():
     print(f"{'Post':<25} {'Likes':<6} {'Comments':<8} {'Age':<8} {'Pop Score':<9} {'Recency':<8} {'Combined':<8}")
     print("-" * 85)
     
-    for post in test_posts:
-        created_at = datetime.now() - timedelta(hours=post["hours_ago"])
-        score, components = calculate_combined_score(
-            post["likes"],
-            post["comments"],
-            created_at
-        )
-        
+    now = datetime.now()
+    scores = calculate_combined_scores(
+        (post["likes"], post["comments"], now - timedelta(hours=post["hours_ago"]))
+        for post in test_posts
+    )
+    
+    for post, (score, components) in zip(test_posts, scores):
         print(f"{post['name']:<25} {post['likes']:<6} {post['comments']:<8} {post['hours_ago']}h{'':<4} "
               f"{components['popularity']:.3f}{'':<5} {components['recency']:.3f}{'':<4} {score:.3f}")
 
@@ -155,7 +160,7 @@ def demo_geographic_features():
     print("\n\n📍 Geographic Features Demo")
     print("=" * 50)
     
-    from app.utils.ranking import haversine_distance
+    from app.utils.ranking import haversine_distances
     
     # Bangkok coordinates
     bangkok = (13.7563, 100.5018)
@@ -171,8 +176,9 @@ def demo_geographic_features():
     print(f"{'Location':<15} {'Distance (km)':<12} {'Travel Category'}")
     print("-" * 45)
     
-    for name, lat, lng in locations:
-        distance = haversine_distance(bangkok[0], bangkok[1], lat, lng)
+    distances = haversine_distances(bangkok[0], bangkok[1], ((lat, lng) for _, lat, lng in locations))
+    
+    for (name, _, _), distance in zip(locations, distances):
         category = "Nearby" if distance < 200 else "Regional" if distance < 500 else "Far"
         print(f"{name:<15} {distance:.0f}{'':<9} {category}")
 
@@ -9,12 +9,16 @@ and integration purposes.
 import json
 import os
 import sys
+from operator import itemgetter
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.main import app
 
+# Operations listed in the endpoint summary
+HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete'})
+
 def export_openapi_schema():
     """Export OpenAPI schema to JSON file"""
     
@@ -35,12 +39,18 @@ def export_openapi_schema():
     
     # Print endpoint summary
     paths = openapi_schema.get('paths', {})
+    endpoints = [
+        (path, method, details)
+        for path, methods in paths.items()
+        for method, details in methods.items()
+        if method in HTTP_METHODS
+    ]
+    endpoints.sort(key=itemgetter(0))
+    
     print("\n📋 Available Endpoints:")
-    for path, methods in paths.items():
-        for method, details in methods.items():
-            if method in ['get', 'post', 'put', 'delete']:
-                summary = details.get('summary', 'No summary')
-                print(f"  {method.upper():<6} {path:<30} - {summary}")
+    for path, method, details in endpoints:
+        summary = details.get('summary', 'No summary')
+        print(f"  {method.upper():<6} {path:<30} - {summary}")
 
 if __name__ == "__main__":
     export_openapi_schema()
\ No newline at end of file
@@ -13,9 +13,9 @@ logger = logging.getLogger(__name__)
 def init_fuzzy_search_extensions():
     """Initialize PostgreSQL extensions for fuzzy search"""
     try:
-        # Check if running on SQLite (testing environment)
-        if 'sqlite' in str(db.engine.url):
-            logger.info("SQLite detected - skipping PostgreSQL extensions")
+        # Extensions below are PostgreSQL-only (SQLite is used for testing)
+        if db.engine.dialect.name != 'postgresql':
+            logger.info(f"{db.engine.dialect.name} detected - skipping PostgreSQL extensions")
             return False
         
         # Enable pg_trgm extension for trigram matching
@@ -29,32 +29,37 @@ def init_fuzzy_search_extensions():
         except Exception as e:
             logger.warning(f"unaccent extension not available: {e}")
         
-        # Create GIN indexes for better fuzzy search performance
+        # Extensions must exist before the gin_trgm_ops indexes can be built
+        db.session.commit()
+        
+        # Create GIN indexes for better fuzzy search performance.
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so
+        # use a separate AUTOCOMMIT connection instead of the session.
         try:
-            # Index for attraction names
-            db.session.execute(text("""
-                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attractions_name_gin 
-                ON attractions USING gin (name gin_trgm_ops);
-            """))
-            
-            # Index for descriptions
-            db.session.execute(text("""
-                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attractions_description_gin 
-                ON attractions USING gin (description gin_trgm_ops);
-            """))
-            
-            # Index for provinces
-            db.session.execute(text("""
-                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attractions_province_gin 
-                ON attractions USING gin (province gin_trgm_ops);
-            """))
+            with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                # Index for attraction names
+                conn.execute(text("""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attractions_name_gin 
+                    ON attractions USING gin (name gin_trgm_ops);
+                """))
+                
+                # Index for descriptions
+                conn.execute(text("""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attractions_description_gin 
+                    ON attractions USING gin (description gin_trgm_ops);
+                """))
+                
+                # Index for provinces
+                conn.execute(text("""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attractions_province_gin 
+                    ON attractions USING gin (province gin_trgm_ops);
+                """))
             
             logger.info("GIN indexes created for fuzzy search")
             
         except Exception as e:
             logger.warning(f"Could not create GIN indexes: {e}")
         
-        db.session.commit()
         logger.info("Fuzzy search extensions initialized successfully")
         return True
         
@@ -67,7 +72,7 @@ def init_fuzzy_search_extensions():
 def create_fuzzy_search_functions():
     """Create custom PostgreSQL functions for advanced fuzzy search"""
     try:
-        if 'sqlite' in str(db.engine.url):
+        if db.engine.dialect.name != 'postgresql':
             return False
         
         # Create a function for fuzzy search with similarity threshold
@@ -82,8 +87,16 @@ def create_fuzzy_search_functions():
                 description TEXT,
                 province VARCHAR(100),
                 similarity_score REAL
-            ) AS $$
+            )
+            -- Scopes the setting to this function: the value set below is
+            -- restored on exit instead of lasting for the caller's transaction
+            SET pg_trgm.similarity_threshold = 0.3
+            AS $$
             BEGIN
+                -- The % operator compares against this setting; SET LOCAL
+                -- cannot take a variable, so use set_config(..., is_local => true)
+                PERFORM set_config('pg_trgm.similarity_threshold', similarity_threshold::text, true);
+                
                 RETURN QUERY
                 SELECT 
                     a.id,
@@ -96,10 +109,12 @@ def create_fuzzy_search_functions():
                         similarity(a.province, search_query)
                     ) as similarity_score
                 FROM attractions a
+                -- % can use the gin_trgm_ops indexes; similarity() is then only
+                -- computed in the SELECT list for the rows that matched
                 WHERE 
-                    similarity(a.name, search_query) > similarity_threshold OR
-                    similarity(a.description, search_query) > similarity_threshold OR
-                    similarity(a.province, search_query) > similarity_threshold
+                    a.name % search_query OR
+                    a.description % search_query OR
+                    a.province % search_query
                 ORDER BY similarity_score DESC;
             END;
             $$ LANGUAGE plpgsql;
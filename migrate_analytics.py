@@ -25,8 +25,7 @@ def create_analytics_table():
             print("✅ API analytics table created successfully!")
             
             # Verify table exists
-            inspector = db.inspect(db.engine)
-            if 'api_analytics' in inspector.get_table_names():
+            if db.inspect(db.engine).has_table('api_analytics'):
                 print("✅ api_analytics table verified in database")
             else:
                 print("❌ api_analytics table not found in database")
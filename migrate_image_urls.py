@@ -1,9 +1,49 @@
 import os
 import psycopg2
+from psycopg2.extras import execute_values
 import json
 from src.config import config
 
 
+_UPDATE_FROM_VALUES = (
+    "UPDATE attractions SET image_urls_new = data.arr "
+    "FROM (VALUES %s) AS data(id, arr) "
+    "WHERE attractions.id = data.id"
+)
+_BATCH_SIZE = 5000
+
+
+def _convert_image_urls_in_python(conn, cur):
+    # Stream rows with the old image_urls through a server-side cursor so
+    # only one batch is held in memory; updates go through the plain cursor
+    sel = conn.cursor(name="attr_stream")
+    sel.itersize = _BATCH_SIZE
+    sel.execute(
+        "SELECT id, image_urls FROM attractions "
+        "WHERE image_urls IS NOT NULL"
+    )
+
+    # Parse the JSON in Python, skipping invalid values and non-arrays,
+    # and update the new column in pages of 1000 rows per round-trip
+    pairs = []
+    for row in sel:
+        try:
+            image_urls_list = json.loads(row[1])
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if isinstance(image_urls_list, list):
+            pairs.append((row[0], image_urls_list))
+        if len(pairs) >= _BATCH_SIZE:
+            execute_values(cur, _UPDATE_FROM_VALUES, pairs,
+                           template="(%s, %s::text[])", page_size=1000)
+            pairs = []
+    sel.close()
+
+    if pairs:
+        execute_values(cur, _UPDATE_FROM_VALUES, pairs,
+                       template="(%s, %s::text[])", page_size=1000)
+
+
 def migrate():
     config_name = os.getenv("FLASK_ENV", "default")
     db_config = config[config_name]
@@ -24,25 +64,22 @@ def migrate():
             "ALTER TABLE attractions ADD COLUMN image_urls_new TEXT[]"
         )
 
-        # 2. Fetch all rows with the old image_urls
-        cur.execute(
-            "SELECT id, image_urls FROM attractions "
-            "WHERE image_urls IS NOT NULL"
-        )
-        rows = cur.fetchall()
-
-        # 3. Update the new column with data from the old column
-        for row in rows:
-            try:
-                image_urls_list = json.loads(row[1])
-                if isinstance(image_urls_list, list):
-                    cur.execute(
-                        "UPDATE attractions SET image_urls_new = %s "
-                        "WHERE id = %s",
-                        (image_urls_list, row[0]),
-                    )
-            except (json.JSONDecodeError, TypeError):
-                continue
+        # 2. Convert the JSON arrays server-side in a single UPDATE.
+        #    A malformed JSON value makes the ::jsonb cast fail, so run it
+        #    under a savepoint and fall back to parsing rows in Python.
+        cur.execute("SAVEPOINT convert_image_urls")
+        try:
+            cur.execute(
+                "UPDATE attractions SET image_urls_new = "
+                "ARRAY(SELECT jsonb_array_elements_text(image_urls::jsonb)) "
+                "WHERE image_urls IS NOT NULL "
+                "AND jsonb_typeof(image_urls::jsonb) = 'array'"
+            )
+            cur.execute("RELEASE SAVEPOINT convert_image_urls")
+        except psycopg2.DataError:
+            cur.execute("ROLLBACK TO SAVEPOINT convert_image_urls")
+            # 3. Parse in Python, skipping invalid JSON, and batch the UPDATEs
+            _convert_image_urls_in_python(conn, cur)
 
         # 4. Drop the old column
         cur.execute("ALTER TABLE attractions DROP COLUMN image_urls")
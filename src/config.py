@@ -40,7 +40,9 @@ class DockerConfig(Config):
 
 class TestingConfig(Config):
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = "sqlite:///test.db"
+    # In-memory SQLite: every test app gets a fresh schema without touching disk
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ECHO = False
 
 
 class ProductionConfig(Config):
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from sqlalchemy import func, desc, distinct
+from sqlalchemy import func, desc, distinct, case
 from src.models import db
 from src.models.api_analytics import APIAnalytics
 
@@ -46,10 +46,11 @@ class AnalyticsService:
     @staticmethod
     def get_request_count_by_period(period='day', start_date=None, end_date=None):
         """Get request count grouped by time period (day/week/month)"""
+        now = datetime.utcnow()
         if not start_date:
-            start_date = datetime.utcnow() - timedelta(days=30)
+            start_date = now - timedelta(days=30)
         if not end_date:
-            end_date = datetime.utcnow()
+            end_date = now
         
         # Use database-agnostic date formatting
         if period == 'day':
@@ -195,26 +196,28 @@ class AnalyticsService:
     @staticmethod
     def get_system_overview(start_date=None, end_date=None):
         """Get overall system analytics overview"""
+        now = datetime.utcnow()
         if not start_date:
-            start_date = datetime.utcnow() - timedelta(days=30)
+            start_date = now - timedelta(days=30)
         if not end_date:
-            end_date = datetime.utcnow()
-        
-        query = db.session.query(APIAnalytics).filter(
+            end_date = now
+        
+        # Compute every figure in one aggregate pass over the date range
+        # instead of issuing a separate COUNT/ORDER BY query for each
+        result = db.session.query(
+            func.count(APIAnalytics.id).label('total_requests'),
+            func.count(distinct(APIAnalytics.endpoint)).label('unique_endpoints'),
+            func.count(distinct(APIAnalytics.source_ip)).label('unique_ips'),
+            # Error rate (4xx and 5xx)
+            func.count(case((APIAnalytics.status_code >= 400, 1))).label('error_requests'),
+            func.max(APIAnalytics.timestamp).label('latest_request')
+        ).filter(
             APIAnalytics.timestamp >= start_date,
             APIAnalytics.timestamp <= end_date
-        )
-        
-        total_requests = query.count()
-        unique_endpoints = query.with_entities(distinct(APIAnalytics.endpoint)).count()
-        unique_ips = query.filter(APIAnalytics.source_ip.isnot(None)).with_entities(distinct(APIAnalytics.source_ip)).count()
-        
-        # Error rate (4xx and 5xx)
-        error_requests = query.filter(APIAnalytics.status_code >= 400).count()
-        error_rate = (error_requests / total_requests * 100) if total_requests > 0 else 0
+        ).one()
         
-        # Get latest request
-        latest_request = query.order_by(desc(APIAnalytics.timestamp)).first()
+        total_requests = result.total_requests
+        error_rate = (result.error_requests / total_requests * 100) if total_requests > 0 else 0
         
         # Handle dates properly - ensure they are datetime objects
         if isinstance(start_date, str):
@@ -224,10 +227,10 @@ class AnalyticsService:
         
         return {
             'total_requests': total_requests,
-            'unique_endpoints': unique_endpoints,
-            'unique_source_ips': unique_ips,
+            'unique_endpoints': result.unique_endpoints,
+            'unique_source_ips': result.unique_ips,
             'error_rate': round(error_rate, 2),
-            'latest_request': latest_request.timestamp.isoformat() if latest_request and latest_request.timestamp else None,
+            'latest_request': result.latest_request.isoformat() if result.latest_request else None,
             'date_range': {
                 'start_date': start_date.isoformat() if hasattr(start_date, 'isoformat') else str(start_date),
                 'end_date': end_date.isoformat() if hasattr(end_date, 'isoformat') else str(end_date)
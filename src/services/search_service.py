@@ -57,8 +57,8 @@ class SearchService:
     def ensure_pg_trgm_extension(self) -> bool:
         """Ensure pg_trgm extension is available (for production use)"""
         try:
-            # Check if running on SQLite (testing)
-            if 'sqlite' in str(db.engine.url):
+            # pg_trgm is PostgreSQL-only (SQLite is used for testing)
+            if db.engine.dialect.name != 'postgresql':
                 return False
             
             # Try to enable pg_trgm extension
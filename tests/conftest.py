@@ -25,7 +25,8 @@ def test_user(app):
     with app.app_context():
         user = User.query.filter_by(username="testuser").first()
         if not user:
-            hashed_password = generate_password_hash("testpassword")
+            # Single PBKDF2 iteration: this fixture only needs a valid hash, not a strong one
+            hashed_password = generate_password_hash("testpassword", method="pbkdf2:sha256:1")
             user = User(username="testuser", password=hashed_password)
             db.session.add(user)
             db.session.commit()
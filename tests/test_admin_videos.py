@@ -63,8 +63,9 @@ def create_admin_user(app, user_data):
         if existing_user:
             return existing_user
         
-        # Create new user
-        hashed_password = generate_password_hash(user_data["password"])
+        # Create new user. A single PBKDF2 iteration keeps fixture setup fast;
+        # check_password_hash reads the method back from the stored hash
+        hashed_password = generate_password_hash(user_data["password"], method="pbkdf2:sha256:1")
         admin_user = User(
             username=user_data["username"],
             email=user_data.get("email"),
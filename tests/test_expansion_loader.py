@@ -77,6 +77,29 @@ class TestExpansionLoader:
             assert "เที่ยว" in travel_expanded
             assert "ท่องเที่ยว" in travel_expanded
     
+    def test_expand_query_cache(self):
+        """Test repeated expansions are cached and safe to modify"""
+        mock_data = {
+            "provinces": {
+                "เชียงใหม่": ["ดอยสุเทพ", "นิมมาน"]
+            }
+        }
+        
+        with patch("builtins.open", mock_open(read_data=json.dumps(mock_data))):
+            loader = ExpansionLoader("fake_file.json")
+            
+            first = loader.expand_query("เชียงใหม่")
+            first.add("mutated")
+            
+            second = loader.expand_query("เชียงใหม่")
+            assert second == {"เชียงใหม่", "ดอยสุเทพ", "นิมมาน"}
+            assert "mutated" not in second
+            
+        # Reloading the data invalidates cached expansions
+        with patch("builtins.open", mock_open(read_data=json.dumps({"provinces": {}}))):
+            loader._load_expansion_data()
+            assert loader.expand_query("เชียงใหม่") == {"เชียงใหม่"}
+    
     def test_find_matching_provinces(self):
         """Test province matching"""
         mock_data = {
@@ -0,0 +1,140 @@
+"""
+Tests for the distance queries used by post location matching and nearby locations
+"""
+import pytest
+import pytest_asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.services.post_service import post_service
+from app.services.location_service import location_service
+from app.schemas.posts import PostCreate, PostMediaCreate
+
+
+@pytest_asyncio.fixture
+async def locations_session():
+    """In-memory SQLite session with a seeded locations table
+
+    The table is created with plain DDL because the models use PostgreSQL
+    ARRAY columns; the distance queries only read these columns.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("""
+            CREATE TABLE locations (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                province TEXT,
+                aliases TEXT,
+                lat FLOAT,
+                lng FLOAT,
+                popularity_score INTEGER,
+                created_at DATETIME
+            )
+        """))
+        await conn.execute(
+            text("""
+                INSERT INTO locations (id, name, province, aliases, lat, lng, popularity_score)
+                VALUES (:id, :name, :province, '', :lat, :lng, :popularity_score)
+            """),
+            [
+                {"id": "loc-grand-palace", "name": "พระบรมมหาราชวัง", "province": "กรุงเทพมหานคร",
+                 "lat": 13.7500, "lng": 100.4913, "popularity_score": 100},
+                {"id": "loc-wat-pho", "name": "วัดโพธิ์", "province": "กรุงเทพมหานคร",
+                 "lat": 13.7465, "lng": 100.4930, "popularity_score": 90},
+                {"id": "loc-doi-suthep", "name": "ดอยสุเทพ", "province": "เชียงใหม่",
+                 "lat": 18.8048, "lng": 98.9217, "popularity_score": 80},
+            ]
+        )
+
+    async with AsyncSession(engine) as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def post_db(locations_session):
+    """Session that runs queries against SQLite but mocks post persistence"""
+    def refresh(post):
+        post.id = "test-post-id"
+        post.like_count = 0
+        post.comment_count = 0
+        post.created_at = datetime.utcnow()
+        post.updated_at = datetime.utcnow()
+
+    mock_session = AsyncMock()
+    mock_session.execute = locations_session.execute
+    mock_session.add = MagicMock()
+    mock_session.refresh.side_effect = refresh
+    return mock_session
+
+
+class TestPostLocationMatching:
+    """Test cases for matching a new post to the nearest location"""
+
+    @pytest.mark.asyncio
+    async def test_create_post_matches_nearest_location(self, post_db):
+        """Test a post with coordinates is matched to the closest location"""
+        post_data = PostCreate(
+            caption="Near the Grand Palace",
+            lat=13.7502,
+            lng=100.4915,
+            media=[PostMediaCreate(media_type="image", url="https://example.com/1.jpg")]
+        )
+
+        result = await post_service.create_post(post_data, "test_user_123", post_db)
+
+        assert result.success is True
+        assert result.location_matched == "พระบรมมหาราชวัง"
+        assert result.post.location_id == "loc-grand-palace"
+
+    @pytest.mark.asyncio
+    async def test_create_post_outside_radius_is_unmatched(self, post_db):
+        """Test a post far from every location is not matched"""
+        post_data = PostCreate(
+            caption="Phuket beach",
+            lat=7.8804,
+            lng=98.3923,
+            media=[PostMediaCreate(media_type="image", url="https://example.com/2.jpg")]
+        )
+
+        result = await post_service.create_post(post_data, "test_user_123", post_db)
+
+        assert result.success is True
+        assert result.location_matched is None
+        assert result.post.location_id is None
+
+
+class TestNearbyLocations:
+    """Test cases for finding locations within a radius"""
+
+    @pytest.mark.asyncio
+    async def test_find_nearby_by_distance(self, locations_session):
+        """Test only locations inside the radius are returned, excluding the center"""
+        locations = await location_service._find_nearby_by_distance(
+            center_lat=13.7500,
+            center_lng=100.4913,
+            radius_km=5.0,
+            exclude_id="loc-grand-palace",
+            db=locations_session
+        )
+
+        assert [location.id for location in locations] == ["loc-wat-pho"]
+
+    @pytest.mark.asyncio
+    async def test_find_nearby_by_distance_orders_by_distance(self, locations_session):
+        """Test results are sorted nearest first"""
+        locations = await location_service._find_nearby_by_distance(
+            center_lat=13.7400,
+            center_lng=100.4930,
+            radius_km=1000.0,
+            exclude_id="none",
+            db=locations_session
+        )
+
+        assert [location.id for location in locations] == [
+            "loc-wat-pho", "loc-grand-palace", "loc-doi-suthep"
+        ]
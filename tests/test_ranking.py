@@ -4,7 +4,10 @@ from app.utils.ranking import (
     calculate_popularity_score,
     calculate_recency_decay,
     calculate_combined_score,
-    haversine_distance
+    calculate_combined_scores,
+    haversine_distance,
+    haversine_distances,
+    bounding_box
 )
 
 
@@ -77,6 +80,30 @@ class TestRanking:
         old_score, _ = calculate_combined_score(50, 10, now - timedelta(days=30))
         assert recent_score > old_score
     
+    def test_calculate_combined_scores(self):
+        """Test batch scoring matches per-item scoring"""
+        now = datetime.utcnow()
+        items = [
+            (100, 20, now - timedelta(hours=1)),
+            (500, 80, now - timedelta(hours=72)),
+            (0, 0, now - timedelta(days=30)),
+        ]
+        
+        batch = calculate_combined_scores(items)
+        assert len(batch) == len(items)
+        
+        for (likes, comments, created_at), (score, components) in zip(items, batch):
+            single_score, single_components = calculate_combined_score(likes, comments, created_at)
+            assert abs(score - single_score) < 1e-6
+            assert components["popularity"] == single_components["popularity"]
+            assert components["combined"] == score
+        
+        # Custom weights are passed through
+        _, components = calculate_combined_scores(items[:1], weights={"w_pop": 1.0, "w_recency": 0.0})[0]
+        assert components["weights_used"] == {"w_pop": 1.0, "w_recency": 0.0}
+        
+        assert calculate_combined_scores([]) == []
+    
     def test_haversine_distance(self):
         """Test geographic distance calculation"""
         # Same point
@@ -98,4 +125,37 @@ class TestRanking:
         # Distance should be symmetric
         d1 = haversine_distance(lat1, lng1, lat2, lng2)
         d2 = haversine_distance(lat2, lng2, lat1, lng1)
-        assert abs(d1 - d2) < 0.001  # Should be essentially equal
\ No newline at end of file
+        assert abs(d1 - d2) < 0.001  # Should be essentially equal
+    
+    def test_haversine_distances(self):
+        """Test batch distance calculation matches single-pair calculation"""
+        bkk_lat, bkk_lng = 13.7563, 100.5018
+        points = [(18.7883, 98.9853), (7.8804, 98.3923), (bkk_lat, bkk_lng)]
+        
+        distances = haversine_distances(bkk_lat, bkk_lng, points)
+        assert len(distances) == len(points)
+        
+        for (lat, lng), distance in zip(points, distances):
+            assert abs(distance - haversine_distance(bkk_lat, bkk_lng, lat, lng)) < 1e-9
+        
+        assert distances[-1] == 0
+        assert haversine_distances(bkk_lat, bkk_lng, []) == []
+    
+    def test_bounding_box(self):
+        """Test bounding box contains every point within the radius"""
+        lat, lng = 13.7563, 100.5018
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, 5.0)
+        
+        assert min_lat < lat < max_lat
+        assert min_lng < lng < max_lng
+        
+        # Box edges sit at (about) the radius from the center
+        assert abs(haversine_distance(lat, lng, max_lat, lng) - 5.0) < 0.01
+        assert haversine_distance(lat, lng, lat, max_lng) >= 5.0 - 0.01
+        
+        # Points just outside the radius along each axis fall outside the box
+        assert not (min_lat <= lat + 0.05 <= max_lat)
+        assert not (min_lng <= lng + 0.06 <= max_lng)
+        
+        # Near the poles the box covers every longitude
+        assert bounding_box(89.99, 0, 5.0)[2:] == (-180.0, 180.0)
@@ -12,6 +12,17 @@ from app.utils.text_normalize import (
 class TestTextNormalization:
     """Test text normalization utilities"""
     
+    def test_normalize_text_cached(self):
+        """Test repeated normalization is served from the cache"""
+        normalize_text.cache_clear()
+        
+        assert normalize_text("  Cached   Query ") == "cached query"
+        assert normalize_text("  Cached   Query ") == "cached query"
+        
+        info = normalize_text.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+    
     def test_normalize_text_basic(self):
         """Test basic text normalization"""
         # English text